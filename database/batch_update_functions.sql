@@ -0,0 +1,67 @@
+-- ═══════════════════════════════════════════════════════════════════════════
+-- Batch Update Functions - one round-trip per batch (RPC)
+-- ═══════════════════════════════════════════════════════════════════════════
+-- Appelées par DataPipeline.batchUpdateStockItems / batchUpdateAGVs via
+-- supabaseClient.rpc(...). Chaque lot est appliqué en un seul UPDATE ... FROM
+-- au lieu d'une requête par ligne.
+--
+-- Une clé absente d'un élément laisse la colonne inchangée (mise à jour
+-- partielle, ex: position seule) ; une clé présente à null efface la colonne
+-- (ex: current_task_id quand l'AGV termine sa tâche).
+--
+-- LANGUAGE plpgsql : l'UPDATE est préparé une fois par connexion PostgREST
+-- et son plan est réutilisé aux appels suivants (une fonction LANGUAGE sql
+-- non-inlinable est re-planifiée à chaque appel).
+--
+-- Script idempotent (CREATE OR REPLACE).
+
+-- ═══════════════════════════════════════════════════════════════════════════
+-- Stock items (clé : location_id, format R1B1L1)
+-- ═══════════════════════════════════════════════════════════════════════════
+CREATE OR REPLACE FUNCTION batch_update_stock_items(items JSONB)
+RETURNS SETOF stock_items
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    UPDATE stock_items s SET
+        fill_level   = CASE WHEN e ? 'fill_level'   THEN (e->>'fill_level')::INT ELSE s.fill_level   END,
+        category     = CASE WHEN e ? 'category'     THEN e->>'category'          ELSE s.category     END,
+        sku          = CASE WHEN e ? 'sku'          THEN e->>'sku'               ELSE s.sku          END,
+        product_name = CASE WHEN e ? 'product_name' THEN e->>'product_name'      ELSE s.product_name END,
+        quality_tier = CASE WHEN e ? 'quality_tier' THEN e->>'quality_tier'      ELSE s.quality_tier END,
+        updated_at   = now()
+    FROM jsonb_array_elements(items) AS e
+    WHERE s.location_id = e->>'location_id'
+    RETURNING s.*;
+END;
+$$;
+
+-- ═══════════════════════════════════════════════════════════════════════════
+-- AGVs (clé : id)
+-- ═══════════════════════════════════════════════════════════════════════════
+CREATE OR REPLACE FUNCTION batch_update_agvs(items JSONB)
+RETURNS SETOF agvs
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    UPDATE agvs a SET
+        x_m             = CASE WHEN e ? 'x_m'             THEN (e->>'x_m')::NUMERIC          ELSE a.x_m             END,
+        y_m             = CASE WHEN e ? 'y_m'             THEN (e->>'y_m')::NUMERIC          ELSE a.y_m             END,
+        z_m             = CASE WHEN e ? 'z_m'             THEN (e->>'z_m')::NUMERIC          ELSE a.z_m             END,
+        rotation_rad    = CASE WHEN e ? 'rotation_rad'    THEN (e->>'rotation_rad')::NUMERIC ELSE a.rotation_rad    END,
+        status          = CASE WHEN e ? 'status'          THEN e->>'status'                  ELSE a.status          END,
+        battery         = CASE WHEN e ? 'battery'         THEN (e->>'battery')::NUMERIC      ELSE a.battery         END,
+        speed_mps       = CASE WHEN e ? 'speed_mps'       THEN (e->>'speed_mps')::NUMERIC    ELSE a.speed_mps       END,
+        current_task_id = CASE WHEN e ? 'current_task_id' THEN e->>'current_task_id'         ELSE a.current_task_id END,
+        updated_at      = now()
+    FROM jsonb_array_elements(items) AS e
+    WHERE a.id = e->>'id'
+    RETURNING a.*;
+END;
+$$;
+
+-- SECURITY INVOKER (défaut) : les politiques RLS de stock_items / agvs s'appliquent
+GRANT EXECUTE ON FUNCTION batch_update_stock_items(JSONB) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION batch_update_agvs(JSONB) TO anon, authenticated;
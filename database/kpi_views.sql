@@ -0,0 +1,55 @@
+-- ═══════════════════════════════════════════════════════════════════════════
+-- KPI Views - Vues agrégées lues par le dashboard KPI
+-- ═══════════════════════════════════════════════════════════════════════════
+-- Séparées de supabase-schema.sql pour pouvoir être ré-appliquées sur une
+-- base existante (le schéma ne peut pas être ré-exécuté : ses
+-- ALTER PUBLICATION ... ADD TABLE échouent sur les tables déjà publiées).
+--
+-- Script idempotent (CREATE OR REPLACE VIEW, colonnes ajoutées en fin de vue).
+
+-- ═══════════════════════════════════════════════════════════════════════════
+-- Stock
+-- ═══════════════════════════════════════════════════════════════════════════
+
+-- Single pass over stock_items (id is the PK, no DISTINCT needed) + location
+-- counts, so the dashboard gets every stock KPI in one request.
+CREATE OR REPLACE VIEW v_kpi_stock AS
+SELECT
+    COUNT(*) as total_items,
+    COUNT(*) FILTER (WHERE si.fill_level > 0) as filled_items,
+    ROUND(100.0 * COUNT(*) FILTER (WHERE si.fill_level > 0) / NULLIF(COUNT(*), 0), 2) as fill_rate_percent,
+    ROUND(AVG(si.fill_level), 2) as avg_fill_level,
+    COUNT(DISTINCT si.category) as unique_categories,
+    99.2 as accuracy_percent,
+    12.5 as inventory_rotation,
+    (SELECT COUNT(*) FROM locations) as total_locations,
+    COUNT(DISTINCT si.location_id) FILTER (WHERE si.fill_level > 0) as filled_locations
+FROM stock_items si;
+
+-- ✅ Note: Views receive realtime updates through underlying tables (stock_items is published)
+
+-- ═══════════════════════════════════════════════════════════════════════════
+-- AGVs
+-- ═══════════════════════════════════════════════════════════════════════════
+
+-- Busy statuses mirror the AGV_STATUS values defined in agv.js
+CREATE OR REPLACE VIEW v_kpi_agv AS
+SELECT
+    COUNT(*) as total_agvs,
+    COUNT(*) FILTER (WHERE a.status = 'idle') as idle_agvs,
+    COUNT(*) FILTER (WHERE a.status = 'moving') as moving_agvs,
+    COUNT(*) FILTER (WHERE a.status = 'charging') as charging_agvs,
+    ROUND(100.0 * COUNT(*) FILTER (WHERE a.status IN (
+        'moving', 'moving_to_pick', 'moving_to_drop', 'loading', 'unloading', 'collecting', 'delivering'
+    )) / NULLIF(COUNT(*), 0), 2) as utilization_percent,
+    ROUND(AVG(a.battery), 2) as avg_battery,
+    24 as missions_per_hour
+FROM agvs a;
+
+-- ✅ Note: Views receive realtime updates through underlying tables (agvs is published)
+
+-- ═══════════════════════════════════════════════════════════════════════════
+-- Vérification
+-- ═══════════════════════════════════════════════════════════════════════════
+SELECT * FROM v_kpi_stock;
+SELECT * FROM v_kpi_agv;
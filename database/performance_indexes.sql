@@ -0,0 +1,52 @@
+-- ═══════════════════════════════════════════════════════════════════════════
+-- Performance Indexes - Index secondaires pour les requêtes de l'application
+-- ═══════════════════════════════════════════════════════════════════════════
+-- PostgreSQL n'indexe pas automatiquement les colonnes FK : sans ces index,
+-- chaque .eq('location_id', ...) et chaque batch UPDATE par location_id
+-- parcourt toute la table stock_items.
+--
+-- Script idempotent (CREATE INDEX IF NOT EXISTS).
+
+-- ═══════════════════════════════════════════════════════════════════════════
+-- stock_items
+-- ═══════════════════════════════════════════════════════════════════════════
+
+-- Lookups par location (management, data-pipeline, batch_update_stock_items)
+CREATE INDEX IF NOT EXISTS idx_stock_items_location_fill
+    ON stock_items (location_id, fill_level);
+
+-- ═══════════════════════════════════════════════════════════════════════════
+-- locations
+-- ═══════════════════════════════════════════════════════════════════════════
+
+-- FK racks → locations (ON DELETE CASCADE)
+CREATE INDEX IF NOT EXISTS idx_locations_rack_id
+    ON locations (rack_id);
+
+-- ═══════════════════════════════════════════════════════════════════════════
+-- tasks
+-- ═══════════════════════════════════════════════════════════════════════════
+
+-- FK agvs / locations → tasks (ON DELETE SET NULL)
+CREATE INDEX IF NOT EXISTS idx_tasks_agv_id
+    ON tasks (agv_id);
+
+CREATE INDEX IF NOT EXISTS idx_tasks_pickup_location_id
+    ON tasks (pickup_location_id);
+
+CREATE INDEX IF NOT EXISTS idx_tasks_dropoff_location_id
+    ON tasks (dropoff_location_id);
+
+-- Mettre à jour les statistiques du planner
+ANALYZE stock_items;
+ANALYZE locations;
+ANALYZE tasks;
+
+-- ═══════════════════════════════════════════════════════════════════════════
+-- Vérification
+-- ═══════════════════════════════════════════════════════════════════════════
+SELECT tablename, indexname, indexdef
+FROM pg_indexes
+WHERE schemaname = 'public'
+AND indexname LIKE 'idx_%'
+ORDER BY tablename, indexname;
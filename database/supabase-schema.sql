@@ -83,6 +83,9 @@ CREATE TABLE IF NOT EXISTS locations (
 
 ALTER TABLE locations ENABLE ROW LEVEL SECURITY;
 
+-- ✅ Enable Realtime for Locations (dt:locations invalide le cache topologie du frontend)
+ALTER PUBLICATION supabase_realtime ADD TABLE locations;
+
 -- ═══════════════════════════════════════════════════════════════════════════
 -- Stock Items
 -- ═══════════════════════════════════════════════════════════════════════════
@@ -155,31 +158,7 @@ ALTER PUBLICATION supabase_realtime ADD TABLE tasks;
 -- Views for KPI Data
 -- ═══════════════════════════════════════════════════════════════════════════
 
-CREATE OR REPLACE VIEW v_kpi_stock AS
-SELECT
-    COUNT(DISTINCT si.id) as total_items,
-    COUNT(DISTINCT CASE WHEN si.fill_level > 0 THEN si.id END) as filled_items,
-    ROUND(100.0 * COUNT(DISTINCT CASE WHEN si.fill_level > 0 THEN si.id END) / NULLIF(COUNT(DISTINCT si.id), 0), 2) as fill_rate_percent,
-    ROUND(AVG(si.fill_level), 2) as avg_fill_level,
-    COUNT(DISTINCT si.category) as unique_categories,
-    99.2 as accuracy_percent,
-    12.5 as inventory_rotation
-FROM stock_items si;
-
--- ✅ Note: Views receive realtime updates through underlying tables (stock_items is published)
-
-CREATE OR REPLACE VIEW v_kpi_agv AS
-SELECT
-    COUNT(DISTINCT a.id) as total_agvs,
-    COUNT(DISTINCT CASE WHEN a.status = 'idle' THEN a.id END) as idle_agvs,
-    COUNT(DISTINCT CASE WHEN a.status = 'moving' THEN a.id END) as moving_agvs,
-    COUNT(DISTINCT CASE WHEN a.status = 'charging' THEN a.id END) as charging_agvs,
-    ROUND(100.0 * COUNT(DISTINCT CASE WHEN a.status IN ('moving', 'collecting', 'delivering') THEN a.id END) / NULLIF(COUNT(DISTINCT a.id), 0), 2) as utilization_percent,
-    ROUND(AVG(a.battery), 2) as avg_battery,
-    24 as missions_per_hour
-FROM agvs a;
-
--- ✅ Note: Views receive realtime updates through underlying tables (agvs is published)
+-- v_kpi_stock / v_kpi_agv : voir kpi_views.sql (script séparé, ré-exécutable sur une base existante)
 
 -- ═══════════════════════════════════════════════════════════════════════════
 -- RLS Policies (Allow public read for demo)
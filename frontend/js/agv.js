@@ -38,6 +38,10 @@ const MOTION = {
     FORK_MAX_HEIGHT: 0.5
 };
 
+// Squared thresholds: per-frame distance checks compare dx²+dz² directly, no sqrt
+const WAYPOINT_TOLERANCE_SQ = MOTION.WAYPOINT_TOLERANCE * MOTION.WAYPOINT_TOLERANCE;
+const APPROACH_DISTANCE_SQ = MOTION.APPROACH_DISTANCE * MOTION.APPROACH_DISTANCE;
+
 const STATUS_COLORS = {
     'idle': 0x20c997,
     'moving': 0x4361ee,
@@ -78,6 +82,7 @@ class AGV {
         // Visual components
         this.model = null;
         this.statusLED = null;
+        this.ledStatus = null; // status currently shown by the LED
         this.wheels = [];
         this.cargoMesh = null;
         this.isCarryingLoad = false;
@@ -259,10 +264,10 @@ class AGV {
         const target = this.path[this.currentWaypointIndex];
         const dx = target.x - this.position.x;
         const dz = target.z - this.position.z;
-        const distance = Math.sqrt(dx * dx + dz * dz);
+        const distanceSq = dx * dx + dz * dz;
 
         // Check if reached waypoint
-        if (distance < MOTION.WAYPOINT_TOLERANCE) {
+        if (distanceSq < WAYPOINT_TOLERANCE_SQ) {
             this.position.x = target.x;
             this.position.z = target.z;
             this.currentWaypointIndex++;
@@ -284,7 +289,7 @@ class AGV {
         if (this.movePhase === MOVE_PHASE.TRAVELING) {
             // Speed logic
             const isLastWaypoint = this.currentWaypointIndex === this.path.length - 1;
-            if (isLastWaypoint && distance < MOTION.APPROACH_DISTANCE) {
+            if (isLastWaypoint && distanceSq < APPROACH_DISTANCE_SQ) {
                 this.targetSpeed = MOTION.APPROACH_SPEED;
             } else {
                 this.targetSpeed = MOTION.MAX_SPEED;
@@ -425,8 +430,9 @@ class AGV {
             this.wheels.forEach(w => w.rotation.x += rot);
         }
 
-        // LED
-        if (this.statusLED) {
+        // LED (only repainted when the status actually changes)
+        if (this.statusLED && this.ledStatus !== this.status) {
+            this.ledStatus = this.status;
             const color = STATUS_COLORS[this.status] || 0x20c997;
             this.statusLED.material.color.setHex(color);
             this.statusLED.material.emissive.setHex(color);
@@ -141,10 +141,10 @@ function animateCamera(camera, controls, targetPos, targetLookAt) {
     const endTarget = new THREE.Vector3(targetLookAt.x, targetLookAt.y, targetLookAt.z);
     
     const duration = 1000; // ms
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     function animate() {
-        const elapsed = Date.now() - startTime;
+        const elapsed = performance.now() - startTime;
         const progress = Math.min(elapsed / duration, 1);
         
         // Ease in-out
@@ -7,31 +7,56 @@ class DataPipeline {
     constructor() {
         this.cache = new Map();
         this.indexedDB = null;
+        this.supabaseReady = null;
         this.dbName = 'WarehouseDB';
         this.dbVersion = 2;
-        this.batchSize = 1000;
         this.apiBase = window.API_CONFIG?.BASE_URL || '/api';
+        this.requestTimeout = 15000; // ms, une requête bloquée ne doit pas figer la page
+        this.locationsCache = null;  // { data, expires } - topologie quasi statique
+        this.locationsTTL = 5 * 60 * 1000;
+        this.locationsVersion = 0;
+        // Colonnes réellement utilisées par les pages (pas de SELECT *)
+        this.columns = {
+            locations: 'id,row_no,bay_no,level_no,x_m,y_m,z_m,occupied',
+            stock_items: 'id,location_id,fill_level,category,sku,product_name,quality_tier',
+            agvs: 'id,name,x_m,y_m,z_m,rotation_rad,status,battery,speed_mps,current_task_id'
+        };
         this.initDB();
+
+        // Toute modification de la topologie invalide le cache
+        window.addEventListener('dt:locations', () => this.invalidateLocations());
     }
 
     /**
      * Wait for Supabase to be initialized
+     * Concurrent callers share a single wait; once ready the client is returned directly.
      */
     async waitForSupabase(maxWait = 10000) {
-        const start = Date.now();
-        
-        while (!window.supabaseClient && Date.now() - start < maxWait) {
-            console.log('⏳ Waiting for Supabase to initialize...');
-            await new Promise(resolve => setTimeout(resolve, 100));
-        }
+        if (window.supabaseClient) return window.supabaseClient;
+
+        if (!this.supabaseReady) {
+            this.supabaseReady = (async () => {
+                const start = Date.now();
 
-        if (!window.supabaseClient) {
-            console.error('❌ Supabase failed to initialize after 10 seconds');
-            throw new Error('Supabase initialization timeout');
+                while (!window.supabaseClient && Date.now() - start < maxWait) {
+                    console.log('⏳ Waiting for Supabase to initialize...');
+                    await new Promise(resolve => setTimeout(resolve, 100));
+                }
+
+                if (!window.supabaseClient) {
+                    console.error('❌ Supabase failed to initialize after 10 seconds');
+                    throw new Error('Supabase initialization timeout');
+                }
+
+                console.log('✅ Supabase ready!');
+                return window.supabaseClient;
+            })();
+
+            // Allow a later call to retry after a timeout
+            this.supabaseReady.catch(() => { this.supabaseReady = null; });
         }
 
-        console.log('✅ Supabase ready!');
-        return window.supabaseClient;
+        return this.supabaseReady;
     }
 
     /**
@@ -43,9 +68,18 @@ class DataPipeline {
             const client = await this.waitForSupabase();
 
             console.log(`📡 Fetching from Supabase table: ${table}`);
-            const { data, error } = await client
-                .from(table)
-                .select(options.select || '*');
+            const controller = new AbortController();
+            const timer = setTimeout(() => controller.abort(), options.timeout || this.requestTimeout);
+            let result;
+            try {
+                result = await client
+                    .from(table)
+                    .select(options.select || this.columns[table] || '*')
+                    .abortSignal(controller.signal);
+            } finally {
+                clearTimeout(timer);
+            }
+            const { data, error } = result;
 
             if (error) {
                 console.error(`❌ Supabase error on ${table}:`, error);
@@ -64,10 +98,20 @@ class DataPipeline {
      * Charger les locations depuis Supabase
      */
     async loadLocations() {
+        // Servi depuis la mémoire jusqu'au TTL ou à un event dt:locations
+        if (this.locationsCache && this.locationsCache.expires > Date.now()) {
+            return this.locationsCache.data;
+        }
+
         try {
             console.log('📍 Fetching locations from Supabase...');
+            const version = this.locationsVersion;
             const locations = await this.fetchFromSupabase('locations');
             console.log(`✅ Loaded ${locations.length} locations`);
+            // Ne pas mettre en cache une réponse invalidée pendant la requête
+            if (locations.length > 0 && version === this.locationsVersion) {
+                this.locationsCache = { data: locations, expires: Date.now() + this.locationsTTL };
+            }
             try { await this.saveData(locations, 'locations'); } catch(e) { console.warn('⚠️ IndexedDB cache failed for locations, using memory only'); }
             return locations;
         } catch (error) {
@@ -76,6 +120,14 @@ class DataPipeline {
         }
     }
 
+    /**
+     * Invalider le cache mémoire des locations
+     */
+    invalidateLocations() {
+        this.locationsCache = null;
+        this.locationsVersion++;
+    }
+
     /**
      * Charger les stock items depuis Supabase
      */
@@ -211,14 +263,13 @@ class DataPipeline {
 
     /**
      * Mettre à jour plusieurs items en batch
+     * Un seul UPDATE ... FROM côté base (voir database/batch_update_functions.sql)
      */
     async batchUpdateStockItems(items) {
         try {
             if (window.supabaseClient) {
                 const { data, error } = await window.supabaseClient
-                    .from('stock_items')
-                    .upsert(items, { onConflict: 'location_id' })
-                    .select();
+                    .rpc('batch_update_stock_items', { items });
 
                 if (error) throw error;
                 console.log(`✅ Batch updated ${data?.length || 0} stock items (Supabase)`);
@@ -247,14 +298,13 @@ class DataPipeline {
 
     /**
      * Mettre à jour plusieurs AGVs en batch
+     * Un seul UPDATE ... FROM côté base (voir database/batch_update_functions.sql)
      */
     async batchUpdateAGVs(agvs) {
         try {
             if (window.supabaseClient) {
                 const { data, error } = await window.supabaseClient
-                    .from('agvs')
-                    .upsert(agvs, { onConflict: 'id' })
-                    .select();
+                    .rpc('batch_update_agvs', { items: agvs });
 
                 if (error) throw error;
                 console.log(`✅ Batch updated ${data?.length || 0} AGVs (Supabase)`);
@@ -347,23 +397,19 @@ class DataPipeline {
     }
 
     /**
-     * Save large dataset to IndexedDB with batch processing
+     * Save large dataset to IndexedDB in a single readwrite transaction
      */
     async saveData(data, storeName = 'stockData') {
         if (!this.indexedDB) await this.initDB();
 
-        const batches = this.createBatches(data, this.batchSize);
-        let savedCount = 0;
-
-        for (const batch of batches) {
-            await this.saveBatch(batch, storeName);
-            savedCount += batch.length;
-            console.log(`💾 Saved ${savedCount}/${data.length} items`);
-        }
+        // Bulk write: every put goes into one readwrite transaction, so the
+        // whole dataset is committed once instead of once per 1000 items
+        await this.saveBatch(data, storeName);
+        console.log(`💾 Saved ${data.length} items`);
 
         // Update cache
         this.cache.set(storeName, data);
-        return savedCount;
+        return data.length;
     }
 
     /**
@@ -450,6 +496,58 @@ class DataPipeline {
         });
     }
 
+    /**
+     * Wrap an async task so at most one run is in flight: calls made while it
+     * runs collapse into a single follow-up run (realtime reload bursts)
+     */
+    coalesce(fn) {
+        let inFlight = null;
+        let queued = false;
+
+        const run = () => {
+            if (inFlight) {
+                queued = true;
+                return inFlight;
+            }
+
+            inFlight = Promise.resolve()
+                .then(fn)
+                .finally(() => {
+                    inFlight = null;
+                    if (queued) {
+                        queued = false;
+                        run();
+                    }
+                });
+            return inFlight;
+        };
+        return run;
+    }
+
+    /**
+     * Keyed lookup over a list: lookup(list, key) returns the first element
+     * whose keyOf() matches. The Map is rebuilt only when another (or a
+     * resized) array is passed, so repeated lookups stay O(1)
+     */
+    createIndex(keyOf) {
+        let indexed = null;
+        let size = -1;
+        let map = new Map();
+
+        return (list, key) => {
+            if (indexed !== list || size !== list.length) {
+                map = new Map();
+                list.forEach(obj => {
+                    const k = keyOf(obj);
+                    if (k != null && !map.has(k)) map.set(k, obj);
+                });
+                indexed = list;
+                size = list.length;
+            }
+            return map.get(key);
+        };
+    }
+
     /**
      * Paginate large datasets
      */
@@ -485,17 +583,6 @@ class DataPipeline {
         });
     }
 
-    /**
-     * Create data batches for processing
-     */
-    createBatches(data, batchSize) {
-        const batches = [];
-        for (let i = 0; i < data.length; i += batchSize) {
-            batches.push(data.slice(i, i + batchSize));
-        }
-        return batches;
-    }
-
     /**
      * Aggregate data for analytics
      */
@@ -643,6 +730,7 @@ class DataPipeline {
      */
     clearCache() {
         this.cache.clear();
+        this.invalidateLocations();
         console.log('🗑️ Cache cleared');
     }
 
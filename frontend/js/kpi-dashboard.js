@@ -3,6 +3,11 @@
  * Fetches KPI data from backend, renders metrics, charts, and alerts.
  */
 
+// Formatters built once: toLocaleTimeString(locale, options) sets up a new
+// Intl formatter on every call (per chart label, per alert, per refresh)
+const TIME_FORMAT_HM = new Intl.DateTimeFormat('fr-FR', { hour: '2-digit', minute: '2-digit' });
+const TIME_FORMAT_HMS = new Intl.DateTimeFormat('fr-FR', { hour: '2-digit', minute: '2-digit', second: '2-digit' });
+
 class KPIDashboard {
     constructor() {
         this.charts = {};
@@ -10,6 +15,8 @@ class KPIDashboard {
         this.refreshInterval = null;
         this.historyHours = 24;
         this.previousData = null;
+        this.kpiCache = new Map();  // path -> { data, expires } | { pending }
+        this.kpiCacheTTL = 5000;    // ms, invalidé aussi par les events realtime
     }
 
     // ═══════════════════════════════════════
@@ -70,9 +77,11 @@ class KPIDashboard {
 
     async fetchAndRender() {
         try {
+            // Independent queries: fetch summary, history and distribution concurrently
             const [summary, history] = await Promise.all([
                 this.fetchJSON('/api/kpis/summary'),
-                this.fetchJSON(`/api/kpis/history?hours=${this.historyHours}`)
+                this.fetchJSON(`/api/kpis/history?hours=${this.historyHours}`),
+                this.fetchStockDistribution()
             ]);
 
             if (summary) {
@@ -88,9 +97,6 @@ class KPIDashboard {
                 this.updateThroughputChart(history);
             }
 
-            // Fetch stock distribution for doughnut
-            await this.fetchStockDistribution();
-
             this.updateTimestamp();
         } catch (err) {
             console.error('[KPI] Fetch error:', err);
@@ -118,35 +124,68 @@ class KPIDashboard {
         }
     }
 
+    /**
+     * Cached KPI fetch: results live for kpiCacheTTL and concurrent callers
+     * for the same path share one in-flight request.
+     */
     async fetchJSON(path) {
+        const cached = this.kpiCache.get(path);
+        if (cached) {
+            if (cached.pending) return cached.pending;
+            if (cached.expires > Date.now()) return cached.data;
+        }
+
+        const entry = { pending: this.queryKPI(path) };
+        this.kpiCache.set(path, entry);
+        const data = await entry.pending;
+
+        // Ne pas écraser une invalidation survenue pendant la requête
+        if (this.kpiCache.get(path) === entry) {
+            if (data) {
+                this.kpiCache.set(path, { data, expires: Date.now() + this.kpiCacheTTL });
+            } else {
+                this.kpiCache.delete(path);
+            }
+        }
+        return data;
+    }
+
+    invalidateKPICache() {
+        this.kpiCache.clear();
+    }
+
+    async queryKPI(path) {
         try {
             // Use Supabase via dataPipeline for all KPI data
             if (path.includes('/summary') || path.includes('/stock_summary')) {
-                const stockItems = await dataPipeline.loadStockItems();
-                const locations = await dataPipeline.loadLocations();
-                const agvs = await dataPipeline.loadAGVs();
+                // Stock and AGV KPIs aggregated in SQL by the v_kpi_* views
+                const [[kpiStock], [kpiAgv]] = await Promise.all([
+                    dataPipeline.fetchFromSupabase('v_kpi_stock'),
+                    dataPipeline.fetchFromSupabase('v_kpi_agv')
+                ]);
                 
-                if (stockItems && locations) {
-                    const totalLocations = locations.length;
-                    const occupiedLocations = stockItems.filter(s => s.fill_level > 0).length;
-                    const avgFillLevel = stockItems.length > 0 
-                        ? stockItems.reduce((sum, s) => sum + (s.fill_level || 0), 0) / stockItems.length 
-                        : 0;
-                    const avgBattery = agvs && agvs.length > 0
-                        ? agvs.reduce((sum, a) => sum + (a.battery || 0), 0) / agvs.length
-                        : 0;
+                // Vue antérieure à kpi_views.sql : ne pas afficher des zéros trompeurs
+                if (kpiStock && kpiStock.total_locations == null) {
+                    console.error('[KPI] v_kpi_stock has no total_locations/filled_locations - run database/kpi_views.sql');
+                    return null;
+                }
+
+                if (kpiStock) {
+                    const totalLocations = Number(kpiStock.total_locations) || 0;
+                    const occupiedLocations = Number(kpiStock.filled_locations) || 0;
+                    const avgFillLevel = Number(kpiStock.avg_fill_level) || 0;
                     
                     return {
                         stock: {
                             fill_rate: totalLocations > 0 ? (occupiedLocations / totalLocations) * 100 : 0,
                             available_locations: totalLocations - occupiedLocations,
-                            total_items: stockItems.length,
+                            total_items: Number(kpiStock.total_items) || 0,
                             avg_fill_level: avgFillLevel
                         },
                         agv: {
-                            utilization_rate: avgBattery,
-                            avg_battery: avgBattery,
-                            total: agvs ? agvs.length : 0
+                            utilization_rate: Number(kpiAgv?.utilization_percent) || 0,
+                            avg_battery: Number(kpiAgv?.avg_battery) || 0,
+                            total: Number(kpiAgv?.total_agvs) || 0
                         },
                         wms: {
                             throughput: 0,
@@ -383,10 +422,7 @@ class KPIDashboard {
     updateThroughputChart(history) {
         if (!this.charts.throughput || !history?.data) return;
 
-        const labels = history.data.map(d => {
-            const date = new Date(d.hour);
-            return date.toLocaleTimeString('fr-FR', { hour: '2-digit', minute: '2-digit' });
-        });
+        const labels = history.data.map(d => TIME_FORMAT_HM.format(new Date(d.hour)));
 
         this.charts.throughput.data.labels = labels;
         this.charts.throughput.data.datasets[0].data = history.data.map(d => d.throughput);
@@ -454,7 +490,7 @@ class KPIDashboard {
         this.alerts.push({
             level,
             message,
-            time: new Date().toLocaleTimeString('fr-FR', { hour: '2-digit', minute: '2-digit', second: '2-digit' })
+            time: TIME_FORMAT_HMS.format(new Date())
         });
     }
 
@@ -511,6 +547,7 @@ class KPIDashboard {
 
                 let refreshTimer = null;
                 this._rtHandler = () => {
+                    this.invalidateKPICache();
                     if (refreshTimer) clearTimeout(refreshTimer);
                     refreshTimer = setTimeout(() => this.fetchAndRender(), 300);
                 };
@@ -535,6 +572,7 @@ class KPIDashboard {
                     { event: '*', schema: 'public', table: 'stock_items' },
                     (payload) => {
                         console.log('[KPI] 📨 Stock update received - reloading dashboard:', payload.eventType);
+                        this.invalidateKPICache();
                         this.fetchAndRender();
                     }
                 )
@@ -548,6 +586,7 @@ class KPIDashboard {
                     { event: '*', schema: 'public', table: 'agvs' },
                     (payload) => {
                         console.log('[KPI] 📨 AGV update received - reloading dashboard:', payload.eventType);
+                        this.invalidateKPICache();
                         this.fetchAndRender();
                     }
                 )
@@ -638,7 +677,7 @@ class KPIDashboard {
     updateTimestamp() {
         const el = document.getElementById('lastUpdate');
         if (el) {
-            el.textContent = `Mis à jour: ${new Date().toLocaleTimeString('fr-FR')}`;
+            el.textContent = `Mis à jour: ${TIME_FORMAT_HMS.format(new Date())}`;
         }
     }
 }
@@ -14,6 +14,10 @@ let loadingManager;
 let simulationSpeed = 1.0;
 let isPaused = false;
 
+// Longest frame the simulation will integrate in one go: after a stall or a
+// hidden tab, AGVs resume where they were instead of jumping ahead
+const MAX_FRAME_DELTA = 0.1; // s
+
 // Navigation and Task Management (global for access by agv.js)
 let navigationGrid = null;
 let taskQueueManager = null;
@@ -296,7 +300,7 @@ function animate() {
 
     if (!isPaused) {
         // Get delta time
-        deltaTime = clock.getDelta() * simulationSpeed;
+        deltaTime = Math.min(clock.getDelta(), MAX_FRAME_DELTA) * simulationSpeed;
         frameCount++;
 
         // Update Task Queue Manager - dispatches tasks to available AGVs
@@ -389,6 +393,9 @@ function onWindowResize() {
  */
 function togglePause() {
     isPaused = !isPaused;
+    if (!isPaused) {
+        clock.getDelta(); // don't count the paused time as one huge frame
+    }
     console.log(isPaused ? '⏸️ Simulation paused' : '▶️ Simulation resumed');
 }
 
@@ -418,7 +425,7 @@ function updateStatsDisplay() {
     const throughputElement = document.getElementById('throughput');
     if (throughputElement) {
         // Calculate based on completed tasks
-        const elapsed = (Date.now() - (taskQueueManager.startTime || Date.now())) / 3600000; // hours
+        const elapsed = (performance.now() - (taskQueueManager.startTime || performance.now())) / 3600000; // hours
         const throughput = elapsed > 0.001 ? Math.round(stats.totalTasksCompleted / elapsed) : 0;
         throughputElement.textContent = throughput;
     }
@@ -48,10 +48,16 @@ class NavigationNode {
     }
 
     distanceTo(other) {
-        return Math.sqrt(
-            Math.pow(this.x - other.x, 2) + 
-            Math.pow(this.z - other.z, 2)
-        );
+        const dx = this.x - other.x;
+        const dz = this.z - other.z;
+        return Math.sqrt(dx * dx + dz * dz);
+    }
+
+    // Squared distance: enough for comparisons, no sqrt
+    distanceSqTo(other) {
+        const dx = this.x - other.x;
+        const dz = this.z - other.z;
+        return dx * dx + dz * dz;
     }
 
     isAvailable() {
@@ -146,9 +152,9 @@ class NavigationGrid {
         nodeArray.forEach(node => {
             nodeArray.forEach(other => {
                 if (node.id !== other.id) {
-                    const dist = node.distanceTo(other);
-                    // Connect nodes that are within one grid step AND aligned
-                    if (dist <= 5.1 && dist > 0) {
+                    const distSq = node.distanceSqTo(other);
+                    // Connect nodes that are within one grid step (5.1) AND aligned
+                    if (distSq <= 5.1 * 5.1 && distSq > 0) {
                         // ONLY connect if they are EXACTLY on the same line (X or Z)
                         const onSameX = Math.abs(node.x - other.x) < 0.1;
                         const onSameZ = Math.abs(node.z - other.z) < 0.1;
@@ -350,12 +356,14 @@ class NavigationGrid {
      */
     findNearestPathNode(x, z) {
         let nearest = null;
-        let minDist = Infinity;
+        let minDistSq = Infinity;
 
         this.pathNodes.forEach(node => {
-            const dist = Math.sqrt(Math.pow(node.x - x, 2) + Math.pow(node.z - z, 2));
-            if (dist < minDist) {
-                minDist = dist;
+            const dx = node.x - x;
+            const dz = node.z - z;
+            const distSq = dx * dx + dz * dz;
+            if (distSq < minDistSq) {
+                minDistSq = distSq;
                 nearest = node;
             }
         });
@@ -368,12 +376,14 @@ class NavigationGrid {
      */
     findNearestNode(x, z) {
         let nearest = null;
-        let minDist = Infinity;
+        let minDistSq = Infinity;
 
         this.nodes.forEach(node => {
-            const dist = Math.sqrt(Math.pow(node.x - x, 2) + Math.pow(node.z - z, 2));
-            if (dist < minDist) {
-                minDist = dist;
+            const dx = node.x - x;
+            const dz = node.z - z;
+            const distSq = dx * dx + dz * dz;
+            if (distSq < minDistSq) {
+                minDistSq = distSq;
                 nearest = node;
             }
         });
@@ -11,7 +11,8 @@
 function createRacks(scene) {
     const rackSystem = {
         racks: [],
-        locations: []
+        locations: [],
+        locationsById: new Map()   // id (R1B1L1) -> location, built once
     };
 
     const rows = 3;
@@ -72,7 +73,7 @@ function createRacks(scene) {
                 createDecking(rackGroup, bayWidth, rackDepth, levelY, deckingMaterial);
 
                 // Store location data
-                rackSystem.locations.push({
+                const rackLocation = {
                     id: `R${row + 1}B${bay + 1}L${level + 1}`,
                     row: row + 1,
                     bay: bay + 1,
@@ -84,7 +85,9 @@ function createRacks(scene) {
                     ),
                     occupied: false,
                     stock: null
-                });
+                };
+                rackSystem.locations.push(rackLocation);
+                rackSystem.locationsById.set(rackLocation.id, rackLocation);
             }
 
             // Add rack label
@@ -259,6 +262,9 @@ function addRackLabel(group, label, x, y) {
  * Get rack location by ID
  */
 function getRackLocation(rackSystem, locationId) {
+    if (rackSystem.locationsById) {
+        return rackSystem.locationsById.get(locationId);
+    }
     return rackSystem.locations.find(loc => loc.id === locationId);
 }
 
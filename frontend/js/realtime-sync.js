@@ -5,6 +5,7 @@
 (function () {
     const state = {
         started: false,
+        starting: null,
         channels: {}
     };
 
@@ -16,8 +17,16 @@
         return window.supabaseClient;
     }
 
-    async function start() {
-        if (state.started) return true;
+    function start() {
+        if (state.started) return Promise.resolve(true);
+        // Callers racing during startup share one subscription pass
+        if (!state.starting) {
+            state.starting = subscribeAll().finally(() => { state.starting = null; });
+        }
+        return state.starting;
+    }
+
+    async function subscribeAll() {
         const client = await waitForSupabase(10000);
         if (!client) {
             console.warn('[RealtimeSync] Supabase not available');
@@ -9,6 +9,13 @@ let sortColumn = 'id';
 let sortDirection = 'asc';
 let virtualScroller = null;
 
+// Predicate behind filteredData (null = all rows), re-applied when rows change
+let activeFilter = null;
+
+function applyActiveFilter() {
+    filteredData = activeFilter ? stockData.filter(activeFilter) : [...stockData];
+}
+
 // Initialize when page loads
 document.addEventListener('DOMContentLoaded', async () => {
     console.log('🚀 Initializing Stock Analysis with Supabase');
@@ -43,12 +50,21 @@ async function loadStockData() {
         console.log('📡 Loading from Docker API...');
         
         // Charger from le backend fastapi local
-        const locations = await dataPipeline.loadLocations();
-        const stock_items = await dataPipeline.loadStockItems();
+        // Both reads in one round-trip time (locations usually come from memory)
+        const [locations, stock_items] = await Promise.all([
+            dataPipeline.loadLocations(),
+            dataPipeline.loadStockItems()
+        ]);
         
         if (locations && locations.length > 0 && stock_items) {
+            // Index stock by location once instead of a find() per location
+            const stockByLocation = new Map();
+            stock_items.forEach(s => {
+                if (!stockByLocation.has(s.location_id)) stockByLocation.set(s.location_id, s);
+            });
+
             stockData = locations.map(loc => {
-                const stock = stock_items.find(s => s.location_id === loc.id);
+                const stock = stockByLocation.get(loc.id);
                 const fillLevel = stock?.fill_level || 0;
                 const occupied = !!stock && fillLevel > 0;
                 return {
@@ -63,13 +79,12 @@ async function loadStockData() {
                     quality_tier: stock?.quality_tier || '-',
                     fillLevel: fillLevel,
                     occupied: occupied,
-                    status: !stock || fillLevel === 0 ? 'Vide' : fillLevel < 25 ? 'Faible' : fillLevel < 75 ? 'Moyen' : fillLevel < 90 ? 'Bon' : 'Plein'
+                    status: getStockStatus(fillLevel)
                 };
             });
             
-            filteredData = [...stockData];
+            applyActiveFilter();
             console.log(`✅ Loaded ${stockData.length} items from Docker API`);
-            console.log('Sample data:', stockData.slice(0, 3));
             return;
         } else {
             console.warn('⚠️ No locations found from API');
@@ -94,28 +109,29 @@ async function loadStockData() {
             }
         }
         
-        filteredData = [...stockData];
+        applyActiveFilter();
         console.log('Stock data loaded:', stockData.length, 'items');
     } catch (error) {
         console.error('Error loading stock data:', error);
         stockData = generateSampleStockData();
-        filteredData = [...stockData];
+        applyActiveFilter();
         await dataPipeline.saveData(stockData, 'stockData');
     }
 }
 
+// Realtime reloads: a burst of events collapses into one follow-up reload
+const scheduleStockReload = dataPipeline.coalesce(async () => {
+    await loadStockData();
+    updateDisplay();
+});
+
 // Connect to Supabase Realtime updates for live stock analysis
 function connectRealtimeUpdates() {
     try {
         if (window.DTRealtime && typeof window.DTRealtime.start === 'function') {
             console.log('[StockAnalysis] ✅ Using shared realtime sync');
             window.DTRealtime.start();
-            window.addEventListener('dt:stock_items', () => {
-                loadStockData().then(() => {
-                    updateDisplay();
-                    console.log('[StockAnalysis] ✅ Table updated');
-                });
-            });
+            window.addEventListener('dt:stock_items', (event) => onStockChange(event.detail));
             return;
         }
 
@@ -131,11 +147,7 @@ function connectRealtimeUpdates() {
             .on('postgres_changes',
                 { event: '*', schema: 'public', table: 'stock_items' },
                 (payload) => {
-                    console.log('[StockAnalysis] 📨 Real-time event received:', payload.eventType);
-                    loadStockData().then(() => {
-                        updateDisplay();
-                        console.log('[StockAnalysis] ✅ Table updated');
-                    });
+                    onStockChange(payload);
                 }
             )
             .subscribe((status) => {
@@ -147,31 +159,59 @@ function connectRealtimeUpdates() {
     }
 }
 
-// Update a single stock item from Supabase change
-function updateStockItem(payload) {
-    const { record } = payload;
-    if (!record || !record.location_id) return;
-    
-    // Find and update the item in stockData
-    const item = stockData.find(s => s.id === record.location_id);
-    if (item) {
-        item.fillLevel = record.fill_level || 0;
-        item.occupied = item.fillLevel > 0;
-        item.status = !record || item.fillLevel === 0 ? 'Vide' : 
-                      item.fillLevel < 25 ? 'Faible' : 
-                      item.fillLevel < 75 ? 'Moyen' : 
-                      item.fillLevel < 90 ? 'Bon' : 'Plein';
-        item.category = record.category || item.category;
-        
-        // Update filtered data if item matches current filters
-        const filteredItem = filteredData.find(s => s.id === record.location_id);
-        if (filteredItem) {
-            Object.assign(filteredItem, item);
+// Status label shown in the table for a fill level
+function getStockStatus(fillLevel) {
+    if (fillLevel === 0) return 'Vide';
+    if (fillLevel < 25) return 'Faible';
+    if (fillLevel < 75) return 'Moyen';
+    if (fillLevel < 90) return 'Bon';
+    return 'Plein';
+}
+
+// stockData rows by location id
+const findStockRow = dataPipeline.createIndex(item => item.id);
+
+// Patch the row of a stock_items UPDATE in place.
+// false = needs a full reload (INSERT/DELETE or location not loaded).
+function applyStockChange(change) {
+    const record = change?.new;
+    if (change?.eventType !== 'UPDATE' || !record || !record.location_id) return false;
+
+    const item = findStockRow(stockData, record.location_id);
+    if (!item) return false;
+
+    item.fillLevel = record.fill_level || 0;
+    item.occupied = item.fillLevel > 0;
+    item.status = getStockStatus(item.fillLevel);
+    item.category = record.category || item.category;
+    item.sku = record.sku || '-';
+    item.product_name = record.product_name || '-';
+    item.quality_tier = record.quality_tier || '-';
+    return true;
+}
+
+let displayUpdateScheduled = false;
+
+function onStockChange(change) {
+    if (!applyStockChange(change)) {
+        scheduleStockReload();
+        return;
+    }
+
+    // Re-render the table once per frame, however many rows changed
+    if (displayUpdateScheduled) return;
+    displayUpdateScheduled = true;
+    requestAnimationFrame(() => {
+        displayUpdateScheduled = false;
+        // A patched row may no longer match (or now match) the active filter
+        if (activeFilter) {
+            applyActiveFilter();
+            sortData();
+            const totalPages = Math.max(1, Math.ceil(filteredData.length / itemsPerPage));
+            currentPage = Math.min(currentPage, totalPages);
         }
-        
-        // Refresh table and charts
         updateDisplay();
-    }
+    });
 }
 
 // Generate sample stock data for demonstration
@@ -201,7 +241,7 @@ function generateSampleStockData() {
                     quality_tier: '-',
                     fillLevel: fillLevel,
                     occupied: occupied,
-                    status: fillLevel === 0 ? 'Vide' : fillLevel < 25 ? 'Faible' : fillLevel < 90 ? 'Moyen' : 'Plein'
+                    status: getStockStatus(fillLevel)
                 });
             }
         }
@@ -236,7 +276,6 @@ function updateTable() {
     const start = (currentPage - 1) * itemsPerPage;
     const end = start + itemsPerPage;
     const pageData = filteredData.slice(start, end);
-    console.log(pageData[0]);
     
     tbody.innerHTML = pageData.map(item => `
         <tr class="category-${item.category}">
@@ -392,11 +431,8 @@ function setupEventListeners() {
             e.currentTarget.classList.add('active');
             
             const filter = e.currentTarget.dataset.filter;
-            if (filter === 'all') {
-                filteredData = [...stockData];
-            } else {
-                filteredData = stockData.filter(item => item.category === filter);
-            }
+            activeFilter = filter === 'all' ? null : item => item.category === filter;
+            applyActiveFilter();
             
             currentPage = 1;
             updateDisplay();
@@ -409,12 +445,13 @@ function setupEventListeners() {
             const filter = e.currentTarget.dataset.filter;
             
             if (filter === 'low') {
-                filteredData = stockData.filter(item => item.fillLevel > 0 && item.fillLevel <= 25);
+                activeFilter = item => item.fillLevel > 0 && item.fillLevel <= 25;
             } else if (filter === 'empty') {
-                filteredData = stockData.filter(item => item.fillLevel === 0);
+                activeFilter = item => item.fillLevel === 0;
             } else if (filter === 'full') {
-                filteredData = stockData.filter(item => item.fillLevel >= 90);
+                activeFilter = item => item.fillLevel >= 90;
             }
+            applyActiveFilter();
             
             // Reset ABC filter
             document.querySelectorAll('.filter-btn-abc').forEach(b => b.classList.remove('active'));
@@ -429,12 +466,12 @@ function setupEventListeners() {
     const searchInput = document.getElementById('search-input');
     searchInput.addEventListener('input', (e) => {
         const query = e.target.value.toLowerCase();
-        filteredData = stockData.filter(item => 
+        activeFilter = item => 
             item.id.toLowerCase().includes(query) ||
             item.sku.toLowerCase().includes(query) ||
             item.position.toLowerCase().includes(query) ||
-            item.category.toLowerCase().includes(query)
-        );
+            item.category.toLowerCase().includes(query);
+        applyActiveFilter();
         currentPage = 1;
         updateDisplay();
     });
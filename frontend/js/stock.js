@@ -97,6 +97,9 @@ function createStock(scene, rackSystem) {
     const stockItems = [];
     const locations = rackSystem.locations;
 
+    // Resolved once for the whole loop
+    const navGrid = typeof getNavigationGrid === 'function' ? getNavigationGrid() : null;
+
     // Fill ALL locations (100%) - real data comes from Supabase sync
     for (let i = 0; i < locations.length; i++) {
         const location = locations[i];
@@ -118,16 +121,15 @@ function createStock(scene, rackSystem) {
         scene.add(stockItem.model);
 
         // Link stock item to nearest navigation storage node
-        const navGrid = typeof getNavigationGrid === 'function' ? getNavigationGrid() : null;
         if (navGrid && navGrid.storageNodes && navGrid.storageNodes.length > 0) {
             let nearestNode = null;
-            let minDist = Infinity;
+            let minDistSq = Infinity;
             navGrid.storageNodes.forEach(node => {
                 const dx = node.x - location.position.x;
                 const dz = node.z - location.position.z;
-                const dist = Math.sqrt(dx * dx + dz * dz);
-                if (dist < minDist) {
-                    minDist = dist;
+                const distSq = dx * dx + dz * dz;
+                if (distSq < minDistSq) {
+                    minDistSq = distSq;
                     nearestNode = node;
                 }
             });
@@ -652,7 +654,7 @@ async function syncStockFromSupabase(stockItems) {
 
         const { data: dbStock, error } = await window.supabaseClient
             .from('stock_items')
-            .select('*');
+            .select(dataPipeline.columns.stock_items);
 
         if (error) {
             console.error('❌ Error fetching stock from Supabase:', error);
@@ -672,11 +674,17 @@ async function syncStockFromSupabase(stockItems) {
             console.log(`🔍 3D location.id format: "${stockItems[0].location?.id}"`);
         }
 
+        // Index 3D items by location.id once (format: R1B1L1)
+        const itemsByLocation = new Map();
+        stockItems.forEach(s => {
+            if (s.location && !itemsByLocation.has(s.location.id)) itemsByLocation.set(s.location.id, s);
+        });
+
         let synced = 0;
         let notFound = 0;
         dbStock.forEach(dbItem => {
             // Match by location_id → location.id in 3D (format: R1B1L1)
-            const item3D = stockItems.find(s => s.location && s.location.id === dbItem.location_id);
+            const item3D = itemsByLocation.get(dbItem.location_id);
             
             if (item3D) {
                 // Apply Supabase data to 3D item
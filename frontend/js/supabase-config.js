@@ -13,10 +13,23 @@ window.SUPABASE_ANON_KEY = 'sb_publishable_NN3OZA6lywEkKLgxpRxBLA_HoQKrbGQ';
 // Initialise le client Supabase GLOBALEMENT
 window.supabaseClient = null;
 
+// Ouvre la connexion (DNS + TCP + TLS) pendant le chargement de la page,
+// pour que la première requête ne paie pas le handshake
+(function preconnectSupabase() {
+    const link = document.createElement('link');
+    link.rel = 'preconnect';
+    link.href = window.SUPABASE_URL;
+    link.crossOrigin = 'anonymous';
+    document.head.appendChild(link);
+})();
+
 /**
  * Initialise la connexion Supabase
  */
 async function initSupabase() {
+    // Déjà initialisé : réutiliser le client (et sa connexion realtime)
+    if (window.supabaseClient) return window.supabaseClient;
+
     try {
         if (!window.supabase || !window.supabase.createClient) {
             throw new Error('❌ Supabase client not loaded. Add the CDN script');
@@ -43,7 +43,9 @@ class Task {
         this.priority = priority;
         this.status = TASK_STATUS.PENDING;
         this.assignedAgvId = null;
-        this.createdAt = Date.now();
+        // createdAt / startedAt / completedAt share the monotonic clock
+        // (performance.now, ms) so they can be subtracted from each other
+        this.createdAt = performance.now();
         this.startedAt = null;
         this.completedAt = null;
     }
@@ -51,7 +53,7 @@ class Task {
     assign(agvId) {
         this.assignedAgvId = agvId;
         this.status = TASK_STATUS.ASSIGNED;
-        this.startedAt = Date.now();
+        this.startedAt = performance.now();
     }
 
     start() {
@@ -60,12 +62,12 @@ class Task {
 
     complete() {
         this.status = TASK_STATUS.COMPLETED;
-        this.completedAt = Date.now();
+        this.completedAt = performance.now();
     }
 
     fail() {
         this.status = TASK_STATUS.FAILED;
-        this.completedAt = Date.now();
+        this.completedAt = performance.now();
     }
 
     getDuration() {
@@ -73,7 +75,7 @@ class Task {
             return (this.completedAt - this.startedAt) / 1000;
         }
         if (this.startedAt) {
-            return (Date.now() - this.startedAt) / 1000;
+            return (performance.now() - this.startedAt) / 1000;
         }
         return 0;
     }
@@ -93,7 +95,7 @@ class TaskQueueManager {
         this.lastTaskGeneration = 0;
         this.taskGenerationInterval = 8000;
         this.completedTasksCount = 0;
-        this.startTime = Date.now();
+        this.startTime = performance.now();
     }
 
     registerFleet(agvs) {
@@ -60,13 +60,22 @@ async function loadWarehouseDataFromSupabase() {
     try {
         console.log('📡 Loading data from Supabase...');
         
-        const locations = await dataPipeline.loadLocations();
-        const stockItems = await dataPipeline.loadStockItems();
+        // Both reads in one round-trip time (locations usually come from memory)
+        const [locations, stockItems] = await Promise.all([
+            dataPipeline.loadLocations(),
+            dataPipeline.loadStockItems()
+        ]);
         
         if (locations && locations.length > 0) {
+            // Index stock by location once instead of a find() per location
+            const stockByLocation = new Map();
+            (stockItems || []).forEach(s => {
+                if (!stockByLocation.has(s.location_id)) stockByLocation.set(s.location_id, s);
+            });
+
             // Map Supabase data to warehouse format
             warehouseData = locations.map(loc => {
-                const stock = stockItems?.find(s => s.location_id === loc.id);
+                const stock = stockByLocation.get(loc.id);
                 const fillLevel = stock?.fill_level || 0;
                 
                 return {
@@ -82,14 +91,12 @@ async function loadWarehouseDataFromSupabase() {
                     fill_level: fillLevel,  // IMPORTANT: Utiliser fill_level pas fillLevel
                     fillLevel: fillLevel,
                     occupied: fillLevel > 0,
-                    status: fillLevel === 0 ? 'empty' : fillLevel < 25 ? 'low' : fillLevel < 90 ? 'medium' : 'full'
+                    status: getStockStatus(fillLevel)
                 };
             });
             
             filteredData = [...warehouseData];
             console.log(`✅ Loaded ${warehouseData.length} locations from Supabase`);
-            console.log('🔍 Sample stock data:', stockItems?.slice(0, 3));
-            console.log('🔍 Sample warehouse data:', warehouseData.slice(0, 3));
             
             // Save to IndexedDB cache
             await dataPipeline.saveData(warehouseData, 'stockData');
@@ -112,6 +119,13 @@ async function loadWarehouseDataFromSupabase() {
     }
 }
 
+// Realtime reloads: a burst of events collapses into one follow-up reload
+const scheduleWarehouseReload = dataPipeline.coalesce(async () => {
+    await loadWarehouseDataFromSupabase();
+    renderWarehouse();
+    updateStatistics();
+});
+
 // Connect to Supabase Realtime updates for live warehouse map
 function connectRealtimeUpdates() {
     try {
@@ -119,16 +133,8 @@ function connectRealtimeUpdates() {
             console.log('[2D] ✅ Using shared realtime sync');
             window.DTRealtime.start();
 
-            const refresh = () => {
-                loadWarehouseDataFromSupabase().then(() => {
-                    renderWarehouse();
-                    updateStatistics();
-                    console.log('[2D] ✅ Warehouse 2D updated');
-                });
-            };
-
-            window.addEventListener('dt:stock_items', refresh);
-            window.addEventListener('dt:locations', refresh);
+            window.addEventListener('dt:stock_items', (event) => onWarehouseStockChange(event.detail));
+            window.addEventListener('dt:locations', scheduleWarehouseReload);
             return;
         }
 
@@ -144,12 +150,7 @@ function connectRealtimeUpdates() {
             .on('postgres_changes',
                 { event: '*', schema: 'public', table: 'stock_items' },
                 (payload) => {
-                    console.log('[2D] 📨 Real-time event received:', payload.eventType, payload.new);
-                    loadWarehouseDataFromSupabase().then(() => {
-                        renderWarehouse();
-                        updateStatistics();
-                        console.log('[2D] ✅ Warehouse 2D updated');
-                    });
+                    onWarehouseStockChange(payload);
                 }
             )
             .subscribe((status) => {
@@ -162,10 +163,7 @@ function connectRealtimeUpdates() {
                 { event: '*', schema: 'public', table: 'locations' },
                 (payload) => {
                     console.log('[2D] Location change detected, reloading...');
-                    loadWarehouseDataFromSupabase().then(() => {
-                        renderWarehouse();
-                        updateStatistics();
-                    });
+                    scheduleWarehouseReload();
                 }
             )
             .subscribe();
@@ -175,34 +173,51 @@ function connectRealtimeUpdates() {
     }
 }
 
-// Update a single warehouse item from Supabase change
-function updateWarehouseItem(payload) {
-    const { record } = payload;
-    if (!record || !record.location_id) return;
-    
-    // Find and update the item in warehouseData
-    const item = warehouseData.find(w => w.id === record.location_id);
-    if (item) {
-        item.fillLevel = record.fill_level || 0;
-        item.occupied = item.fillLevel > 0;
-        item.status = item.fillLevel === 0 ? 'empty' : 
-                      item.fillLevel < 25 ? 'low' : 
-                      item.fillLevel < 90 ? 'medium' : 'full';
-        item.category = record.category || item.category;
-        item.sku = record.sku || '-';
-        item.product_name = record.product_name || '-';
-        item.quality_tier = record.quality_tier || '-';
-        
-        // Update filtered data if item matches current filters
-        const filteredItem = filteredData.find(w => w.id === record.location_id);
-        if (filteredItem) {
-            Object.assign(filteredItem, item);
+// warehouseData cells by location id
+const findWarehouseCell = dataPipeline.createIndex(w => w.id);
+
+// Realtime stock_items UPDATE → update the matching cell's data.
+// Returns false if the map has to be reloaded instead.
+function applyWarehouseChange(change) {
+    const record = change?.new;
+    if (change?.eventType !== 'UPDATE' || !record || !record.location_id) return false;
+
+    const item = findWarehouseCell(warehouseData, record.location_id);
+    if (!item) return false;
+
+    const fillLevel = record.fill_level || 0;
+    item.fill_level = fillLevel;
+    item.fillLevel = fillLevel;
+    item.occupied = fillLevel > 0;
+    item.status = getStockStatus(fillLevel);
+    item.category = record.category || item.category;
+    item.sku = record.sku || '-';
+    item.product_name = record.product_name || '-';
+    item.quality_tier = record.quality_tier || '-';
+    return true;
+}
+
+let renderScheduled = false;
+
+function onWarehouseStockChange(change) {
+    if (!applyWarehouseChange(change)) {
+        scheduleWarehouseReload();
+        return;
+    }
+
+    // Batch the map redraw to the next animation frame
+    if (renderScheduled) return;
+    renderScheduled = true;
+    requestAnimationFrame(() => {
+        renderScheduled = false;
+        // The status filter depends on fill_level: re-run it on the patched data
+        if (currentFilters.status) {
+            applyFilters();
+            return;
         }
-        
-        // Re-render affected cells
         renderWarehouse();
         updateStatistics();
-    }
+    });
 }
 
 // Initialize all event listeners
@@ -540,8 +555,6 @@ function getStatusColor(fillLevel) {
 
 // Show details modal
 function showDetails(item) {
-    console.log('🔍 Showing details for item:', item);  // DEBUG
-    
     const modal = document.getElementById('detail-modal');
     const modalTitle = document.getElementById('modal-title');
     const modalDetails = document.getElementById('modal-details');
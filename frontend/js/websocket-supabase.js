@@ -63,6 +63,16 @@ async function initWebSocket(agvs, stockItems) {
 
     console.log('✅ Supabase Client détecté.');
 
+    // Un seul jeu de channels par page : si DTRealtime est chargé, on consomme
+    // ses events au lieu d'ouvrir des abonnements en double sur les mêmes tables
+    if (window.DTRealtime && typeof window.DTRealtime.start === 'function') {
+        window.addEventListener('dt:agvs', onSharedAgvChange);
+        window.addEventListener('dt:stock_items', onSharedStockChange);
+        window.DTRealtime.start();
+        console.log('✅ Realtime 3D branché sur DTRealtime (channels partagés)');
+        return;
+    }
+
     // 2. Abonnement aux AGVs (Table 'agvs')
     supabaseChannels.agvs = supabaseClient
         .channel('realtime_agvs')
@@ -70,7 +80,6 @@ async function initWebSocket(agvs, stockItems) {
             'postgres_changes',
             { event: '*', schema: 'public', table: 'agvs' },
             (payload) => {
-                console.log(`📥 REÇU AGV UPDATE:`, payload.new);
                 applyAgvUpdate(payload.new);
             }
         )
@@ -85,7 +94,6 @@ async function initWebSocket(agvs, stockItems) {
             'postgres_changes',
             { event: '*', schema: 'public', table: 'stock_items' },
             (payload) => {
-                console.log(`📥 REÇU STOCK UPDATE:`, payload.new);
                 applyStockUpdate(payload.new);
             }
         )
@@ -93,25 +101,27 @@ async function initWebSocket(agvs, stockItems) {
             console.log(`📡 Statut connexion Stock: ${status}`);
         });
 
-    // 4. Abonnement aux Tasks (Table 'tasks')
-    supabaseChannels.tasks = supabaseClient
-        .channel('realtime_tasks')
-        .on(
-            'postgres_changes',
-            { event: '*', schema: 'public', table: 'tasks' },
-            (payload) => {
-                console.log(`📥 REÇU TASK UPDATE:`, payload.new);
-            }
-        )
-        .subscribe();
-
     console.log('✅ Tous les abonnements Realtime sont actifs !');
 }
 
+function onSharedAgvChange(event) {
+    const row = event.detail?.new;
+    if (row && row.id) applyAgvUpdate(row);
+}
+
+function onSharedStockChange(event) {
+    const row = event.detail?.new;
+    if (row && row.location_id) applyStockUpdate(row);
+}
+
 // ═══════════════════════════════════════════════════════════════════════════
 // Core Logic : Finding & Updating Objects (CASE INSENSITIVE FIX)
 // ═══════════════════════════════════════════════════════════════════════════
 
+// Index des objets 3D par clé : lookup O(1) par message au lieu d'un find()
+const findSceneAgv = dataPipeline.createIndex(a => a.id.toLowerCase());
+const findSceneStock = dataPipeline.createIndex(s => s.location?.id);
+
 function applyAgvUpdate(data) {
     // 1. Récupérer la liste des AGVs depuis la source la plus fiable (Global)
     const agvList = window.digitalTwin?.agvs || window.agvs || [];
@@ -122,11 +132,9 @@ function applyAgvUpdate(data) {
     }
 
     // 2. Recherche "Insensible à la casse" (Fix du problème AGV-001 vs agv-001)
-    const agv = agvList.find(a => a.id.toLowerCase() === data.id.toLowerCase());
+    const agv = findSceneAgv(agvList, data.id.toLowerCase());
 
     if (agv) {
-        console.log(`✅ Sync AGV [${agv.id}] -> x:${data.x_m}, z:${data.z_m}, status:${data.status}`);
-
         // Realtime takes control: prevent local simulation from overriding
         agv.externalControl = true;
         agv.path = [];
@@ -180,10 +188,9 @@ function applyStockUpdate(data) {
     }
 
     // Recherche par location_id (plus fiable que l'ID)
-    const item = stockList.find(s => s.location && s.location.id === data.location_id);
+    const item = findSceneStock(stockList, data.location_id);
 
     if (item) {
-        console.log(`📦 Stock Update [${data.location_id}]: Level ${data.fill_level}`);
         if (data.fill_level !== undefined && item.setFillLevel) {
             item.setFillLevel(data.fill_level);
         }
@@ -246,6 +253,9 @@ async function pushAGVToSupabase(agv) {
  * Close all subscriptions
  */
 function closeWebSocket() {
+    window.removeEventListener('dt:agvs', onSharedAgvChange);
+    window.removeEventListener('dt:stock_items', onSharedStockChange);
+
     if (!supabaseClient) return;
     
     Object.values(supabaseChannels).forEach(channel => {